@@ -13,7 +13,7 @@ Public API (as required by the original assignment):
                      start: tuple[int, int],
                      dest: tuple[int, int]) -> int
 - Checkers.get_checker_details(square: tuple[int, int]) -> str | None
-- Checkers.print_board() -> None
+- Checkers.print_board(file=None) -> None
 - Checkers.game_winner() -> str
 
 - Player.get_king_count() -> int
@@ -21,6 +21,9 @@ Public API (as required by the original assignment):
 - Player.get_captured_pieces_count() -> int
 """
 
+import random
+import sys
+
 class OutofTurn(Exception):
     """Raised when a player attempts to move out of turn."""
     pass
@@ -41,6 +44,251 @@ class InvalidMove(Exception):
     pass
 
 
+# Piece codes used internally. Kings are the base color + 2 and triple kings
+# the base color + 4; _NAMES maps each code back to its public string.
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+BLACK_K = 3
+WHITE_K = 4
+BLACK_TK = 5
+WHITE_TK = 6
+
+_NAMES = (None, "Black", "White", "Black_king", "White_king",
+          "Black_Triple_King", "White_Triple_King")
+
+# Two-character cells used by print_board, indexed by piece code.
+_GLYPHS = ("..", "b ", "w ", "bK", "wK", "bT", "wT")
+
+# The board is stored as bitboards over the 32 dark squares. Square n sits at
+# row n // 4, counted from White's back row, so row 0 holds squares 0-3.
+
+# (row, col) of each dark square.
+_COORDS = tuple((square // 4, (square % 4) * 2 + (1 - square // 4 % 2)) for square in range(32))
+
+
+def _build_move_tables():
+    """
+    Map every (square, piece) pair to the moves the piece may make from it,
+    keeping only moves that stay on the board and go in an allowed direction
+    (normal pieces only move forward).
+
+    Returns:
+        tuple[dict, dict]:
+            The step table, giving a tuple of destination squares, and the
+            jump table, giving a tuple of (jumped square, landing square)
+            pairs.
+    """
+    row_steps = {
+        BLACK: (-1,),
+        WHITE: (1,),
+        BLACK_K: (-1, 1),
+        WHITE_K: (-1, 1),
+        BLACK_TK: (-1, 1),
+        WHITE_TK: (-1, 1),
+    }
+    step_table = {}
+    jump_table = {}
+
+    for square in range(32):
+        row, col = _COORDS[square]
+
+        for piece, directions in row_steps.items():
+            steps = []
+            jumps = []
+
+            for row_step in directions:
+                for col_step in (-1, 1):
+                    step_row, step_col = row + row_step, col + col_step
+                    land_row, land_col = row + 2 * row_step, col + 2 * col_step
+
+                    if 0 <= step_row <= 7 and 0 <= step_col <= 7:
+                        steps.append(step_row * 4 + step_col // 2)
+
+                    if 0 <= land_row <= 7 and 0 <= land_col <= 7:
+                        jumps.append((step_row * 4 + step_col // 2, land_row * 4 + land_col // 2))
+
+            step_table[(square, piece)] = tuple(steps)
+            jump_table[(square, piece)] = tuple(jumps)
+
+    return step_table, jump_table
+
+
+_STEP_TABLE, _MOVE_TABLE = _build_move_tables()
+
+# (destination row, piece) -> promoted piece
+_PROMOTE = {
+    (0, BLACK): BLACK_K,
+    (7, WHITE): WHITE_K,
+    (0, WHITE_K): WHITE_TK,
+    (7, BLACK_K): BLACK_TK,
+}
+
+_COLOR_CODES = {"Black": BLACK, "White": WHITE}
+
+# Zobrist keys: one random 64-bit number per (square, piece code), plus one
+# for White to move. A position's hash is the XOR of the keys that apply.
+# The generator is seeded so hashes are stable from run to run.
+_zobrist_rng = random.Random(0x5EED)
+_ZOBRIST = [[_zobrist_rng.getrandbits(64) for _ in range(7)] for _ in range(32)]
+_ZOBRIST_TURN = _zobrist_rng.getrandbits(64)
+
+# Status codes returned by the move kernels, and the exception each one maps to.
+_STATUS_OK = 0
+_STATUS_INVALID_SQUARE = 1
+_STATUS_INVALID_MOVE = 2
+_STATUS_OUT_OF_TURN = 3
+
+_STATUS_ERRORS = {
+    _STATUS_INVALID_SQUARE: InvalidSquare,
+    _STATUS_INVALID_MOVE: InvalidMove,
+    _STATUS_OUT_OF_TURN: OutofTurn,
+}
+
+
+def _piece_on(bb_black, bb_white, bb_kings, bb_triple, square):
+    """
+    Return the piece code on the given 0-31 dark square of the bitboards.
+    """
+    mask = 1 << square
+
+    if mask & bb_black:
+        piece = BLACK
+    elif mask & bb_white:
+        piece = WHITE
+    else:
+        return EMPTY
+
+    if mask & bb_triple:
+        return piece + 4
+    elif mask & bb_kings:
+        return piece + 2
+    else:
+        return piece
+
+
+# Source for the move kernels built by _make_play: the integer-only core of
+# Checkers.play_game, with the mover's color and the move kind baked in as
+# constants. A kernel never raises; rule violations come back as status
+# codes, checked in this order:
+#   - start off the board, on a light square, or not the mover's piece
+#   - destination off the board (both InvalidSquare)
+#   - not a diagonal step or jump of the kernel's kind
+#   - out of turn, then a normal piece moving backward
+#   - destination occupied, then a jump over anything but an enemy piece
+_PLAY_TEMPLATE = """
+def {name}(bb_black, bb_white, bb_kings, bb_triple, turn, sr, sc, dr, dc):
+    if not (0 <= sr <= 7 and 0 <= sc <= 7) or (sr + sc) % 2 == 0:
+        return _STATUS_INVALID_SQUARE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    start_square = sr * 4 + sc // 2
+    start_mask = 1 << start_square
+
+    if not start_mask & bb_{own}:
+        return _STATUS_INVALID_SQUARE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    if not (0 <= dr <= 7 and 0 <= dc <= 7):
+        return _STATUS_INVALID_SQUARE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    if abs(dr - sr) != {step} or abs(dc - sc) != {step}:
+        return _STATUS_INVALID_MOVE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    if turn != {color}:
+        return _STATUS_OUT_OF_TURN, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    if start_mask & bb_triple:
+        piece = {color} + 4
+    elif start_mask & bb_kings:
+        piece = {color} + 2
+    elif {backward}:
+        return _STATUS_INVALID_MOVE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+    else:
+        piece = {color}
+
+    destination_square = dr * 4 + dc // 2
+    destination_mask = 1 << destination_square
+
+    if (bb_black | bb_white) & destination_mask:
+        return _STATUS_INVALID_MOVE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    move_mask = start_mask | destination_mask
+    {own} = bb_{own} ^ move_mask
+    {enemy} = bb_{enemy}
+    kings = bb_kings ^ move_mask if start_mask & bb_kings else bb_kings
+    triple = bb_triple ^ move_mask if start_mask & bb_triple else bb_triple
+    captured = 0
+    hash_delta = _ZOBRIST[start_square][piece]
+{jump}
+    piece_after_move = piece
+    promoted = _PROMOTE.get((dr, piece), EMPTY)
+
+    if promoted != EMPTY:
+        piece_after_move = promoted
+        kings ^= destination_mask
+
+        if promoted > WHITE_K:
+            triple |= destination_mask
+
+    hash_delta ^= _ZOBRIST[destination_square][piece_after_move]
+    empty = ~(black | white)
+    more_jumps = any((1 << land) & empty and (1 << mid) & {enemy}
+                     for mid, land in _MOVE_TABLE[(destination_square, piece_after_move)])
+
+    return _STATUS_OK, black, white, kings, triple, captured, promoted, more_jumps, hash_delta
+"""
+
+_JUMP_TEMPLATE = """
+    mid_square = ((sr + dr) >> 1) * 4 + ((sc + dc) >> 1) // 2
+    mid_mask = 1 << mid_square
+
+    if not mid_mask & bb_{enemy}:
+        return _STATUS_INVALID_MOVE, bb_black, bb_white, bb_kings, bb_triple, 0, EMPTY, False, 0
+
+    hash_delta ^= _ZOBRIST[mid_square][_piece_on(bb_black, bb_white, bb_kings, bb_triple, mid_square)]
+    keep = ~mid_mask
+    {enemy} &= keep
+    kings &= keep
+    triple &= keep
+    captured = 1
+"""
+
+
+def _make_play(color, is_jump):
+    """
+    Build the move kernel for one color and move kind.
+
+    Args:
+        color (str): "Black" or "White", the color of the moving player.
+        is_jump (bool): True for two-square jumps, False for one-square steps.
+
+    Returns:
+        function:
+            A kernel taking (bb_black, bb_white, bb_kings, bb_triple, turn,
+            sr, sc, dr, dc) and returning (status, bb_black, bb_white,
+            bb_kings, bb_triple, captured, promoted, more_jumps, hash_delta),
+            where captured is the number of pieces taken (0 or 1), promoted
+            is the new piece code or EMPTY, more_jumps is True if the moved
+            piece can jump again, and hash_delta is the value to XOR into
+            the position's Zobrist hash. If status is not _STATUS_OK the
+            bitboards are returned unchanged. Moves of the other kind are
+            rejected with _STATUS_INVALID_MOVE.
+    """
+    own, enemy = ("black", "white") if color == "Black" else ("white", "black")
+    name = f"_play_{'jump' if is_jump else 'step'}_{own}"
+    source = _PLAY_TEMPLATE.format(
+        name=name,
+        color=color.upper(),
+        own=own,
+        enemy=enemy,
+        step=2 if is_jump else 1,
+        # Normal pieces may only move toward the opponent's side.
+        backward="dr >= sr" if color == "Black" else "dr <= sr",
+        jump=_JUMP_TEMPLATE.format(enemy=enemy) if is_jump else "",
+    )
+    namespace = {}
+    exec(compile(source, f"<{name}>", "exec"), globals(), namespace)
+    return namespace[name]
+
 
 class Checkers:
     """
@@ -49,51 +297,135 @@ class Checkers:
     and determine if there is a winner.
     """
 
+    # Kernels specialized by (player color, is the move a jump), used by play_game.
+    _play_variants = {(color, is_jump): _make_play(color, is_jump)
+                      for color in ("Black", "White") for is_jump in (False, True)}
+
+    __slots__ = ("_bb_black", "_bb_white", "_bb_kings", "_bb_triple", "_players",
+                 "_players_by_name", "_turn", "_game_status", "_winner",
+                 "_last_destination", "_last_turn_finished", "_hash",
+                 "_black_squares", "_white_squares")
+
     def __init__(self):
         """
         Initializes the board, turn color, game status, a winner, the last destination, and
         if the last turn was finished. It takes no parameters. All data members are private.
         """
-        self._board = [[None, "White", None, "White", None, "White", None, "White"],
-                       ["White", None, "White", None, "White", None, "White", None],
-                       [None, "White", None, "White", None, "White", None, "White"],
-                       ["Empty", None, "Empty", None, "Empty", None, "Empty", None],
-                       [None, "Empty", None, "Empty", None, "Empty", None, "Empty"],
-                       ["Black", None, "Black", None, "Black", None, "Black", None],
-                       [None, "Black", None, "Black", None, "Black", None, "Black"],
-                       ["Black", None, "Black", None, "Black", None, "Black", None],]
+        # One bit per dark square: White starts on squares 0-11, Black on 20-31.
+        self._bb_black = 0xFFF00000
+        self._bb_white = 0x00000FFF
+        self._bb_kings = 0
+        self._bb_triple = 0
+
+        # Occupied squares per color, kept in step with the bitboards so
+        # code that visits every piece never scans the whole board.
+        self._black_squares = set(range(20, 32))
+        self._white_squares = set(range(12))
 
         self._players = []
+        self._players_by_name = {}
         self._turn = "Black"
         self._game_status = "Active"
         self._winner = None
         self._last_destination = None
         self._last_turn_finished = True
 
-    def _is_on_board(self, row, col):
+        self._hash = 0
+
+        for square in range(32):
+            piece = self._piece_at(square)
+
+            if piece != EMPTY:
+                self._hash ^= _ZOBRIST[square][piece]
+
+    def copy(self):
+        """
+        Return an independent copy of the game, including its players.
+
+        Notes:
+            The bitboards and counters are copied directly rather than
+            rebuilding the board, so cloning a position is cheap for tests
+            and search code.
+        """
+        game = Checkers.__new__(Checkers)
+
+        # Every slot is carried over, so new state cannot be left out; the
+        # containers are then replaced with copies of their own.
+        for slot in Checkers.__slots__:
+            setattr(game, slot, getattr(self, slot))
+
+        game._black_squares = set(self._black_squares)
+        game._white_squares = set(self._white_squares)
+        game._players = []
+        game._players_by_name = {}
+
+        for player in self._players:
+            clone = Player(player.get_player_name(), player.get_piece_color())
+            clone._apply(captures=player.get_captured_pieces_count(),
+                         kings=player.get_king_count(),
+                         triples=player.get_triple_king_count())
+            game._players.append(clone)
+            game._players_by_name[clone.get_player_name()] = clone
+
+        return game
+
+    def _piece_at(self, square):
         """
-        Return True if (row, col) is a valid board coordinate.
+        Return the piece code on the given 0-31 dark square.
         """
-        return 0 <= row <= 7 and 0 <= col <= 7
+        return _piece_on(self._bb_black, self._bb_white, self._bb_kings, self._bb_triple, square)
+
+    def _checker_at(self, square_location):
+        """
+        Return the piece code at a (row, col) location; EMPTY for light squares.
+
+        Raises:
+            InvalidSquare:
+                If the square is outside the bounds of the board.
+        """
+        x_coord, y_coord = square_location
+
+        if x_coord < 0 or x_coord > 7 or y_coord < 0 or y_coord > 7:
+            raise InvalidSquare
+
+        if (x_coord + y_coord) % 2 == 0:
+            return EMPTY  # light squares never hold a piece
+
+        return self._piece_at(x_coord * 4 + y_coord // 2)
 
     def get_board(self):
         """
-        Return the internal board representation.
+        Build the board as a nested list from the bitboards.
 
         Returns:
             list[list[str | None]]:
                 A nested list representing the 8×8 game board.
                 Each element may be:
-                    - None
+                    - None for light squares
+                    - "Empty" for unoccupied dark squares
                     - "White", "Black"
                     - "White_king", "Black_king"
                     - "White_Triple_King", "Black_Triple_King"
 
         Notes:
             This method exposes the board state primarily for debugging
-            and unit testing purposes.
+            and unit testing purposes. The list is a snapshot; changing it
+            does not change the game.
         """
-        return self._board
+        board = []
+
+        for row in range(8):
+            cells = []
+
+            for col in range(8):
+                if (row + col) % 2 == 0:
+                    cells.append(None)
+                else:
+                    cells.append(self.get_checker_details((row, col)) or "Empty")
+
+            board.append(cells)
+
+        return board
 
     def get_player_object(self, player_name):
         """
@@ -111,11 +443,10 @@ class Checkers:
                 If the name does not correspond to any existing player.
         """
 
-        for player in self._players:
-            if player_name == player.get_player_name():
-                return player
-
-        raise InvalidPlayer(f"Unknown player: {player_name}")
+        try:
+            return self._players_by_name[player_name]
+        except KeyError:
+            raise InvalidPlayer(f"Unknown player: {player_name}") from None
 
 
     def get_turn(self):
@@ -170,6 +501,26 @@ class Checkers:
 
         return self._last_turn_finished
 
+    def get_hash(self):
+        """
+        Return a 64-bit Zobrist hash of the position.
+
+        Returns:
+            int:
+                A hash of the pieces on the board and the color to move.
+                Positions reached by different move orders hash equally,
+                so the value can key a transposition table.
+
+        Notes:
+            The piece part of the hash is updated incrementally in
+            play_game; the side to move is folded in here.
+        """
+
+        if self._turn == "White":
+            return self._hash ^ _ZOBRIST_TURN
+
+        return self._hash
+
 
     def get_status(self):
         """
@@ -207,12 +558,12 @@ class Checkers:
             raise InvalidPlayer(f"Invalid piece color: {piece_color}")
 
         # Enforce unique player names
-        for player in self._players:
-            if player.get_player_name() == player_name:
-                raise InvalidPlayer(f"Player name already exists: {player_name}")
+        if player_name in self._players_by_name:
+            raise InvalidPlayer(f"Player name already exists: {player_name}")
 
         player = Player(player_name, piece_color)
         self._players.append(player)
+        self._players_by_name[player_name] = player
         return player
 
     def play_game(self, player_name, starting_square_location, destination_square_location):
@@ -237,183 +588,123 @@ class Checkers:
             InvalidMove: If the move does not comply with the rules.
         """
 
+        sr, sc = starting_square_location
+        dr, dc = destination_square_location
+
         player_object = self.get_player_object(player_name)
 
-        piece = self.get_checker_details(starting_square_location)
+        color = player_object._piece_color
 
-        if piece is None:
-            raise InvalidSquare  # no piece at starting location
+        # Continuing a multi-jump hands the turn back to the jumping player.
+        continuing = starting_square_location == self._last_destination and not self._last_turn_finished
 
-        color = player_object.get_piece_color()
+        turn = self._turn
 
-        if color == "White" and not piece.startswith("White"):
-            raise InvalidSquare
+        if continuing:
+            turn = "White" if turn == "Black" else "Black"
 
-        if color == "Black" and not piece.startswith("Black"):
-            raise InvalidSquare
+        kernel = self._play_variants[(color, abs(dr - sr) == 2)]
 
-        movement_direction_x = int((destination_square_location[0] - starting_square_location[0]))
+        status, black, white, kings, triple, captured, promoted, more_jumps, hash_delta = kernel(
+            self._bb_black, self._bb_white, self._bb_kings, self._bb_triple,
+            _COLOR_CODES[turn], sr, sc, dr, dc)
 
-        movement_direction_y = int((destination_square_location[1] - starting_square_location[1]))
+        if status != _STATUS_OK:
+            raise _STATUS_ERRORS[status]
 
-        # Enforce diagonal movement:
-        # - Simple moves: exactly 1 square diagonally
-        # - Jump moves: exactly 2 squares diagonally
-        if not (
-            (abs(movement_direction_x) == 1 and abs(movement_direction_y) == 1) or
-            (abs(movement_direction_x) == 2 and abs(movement_direction_y) == 2)
-        ):
-            raise InvalidMove
-
-        if starting_square_location == self.get_last_destination() and not self.get_last_turn_finished():
+        if continuing:
             self.change_turn()
             self._last_turn_finished = True
 
+        self._bb_black, self._bb_white = black, white
+        self._bb_kings, self._bb_triple = kings, triple
+        self._hash ^= hash_delta
 
-        if self.get_turn() != player_object.get_piece_color():
-            raise OutofTurn
-
-        if starting_square_location[0] > 7 or starting_square_location[1] > 7:
-            raise InvalidSquare
-
-        if starting_square_location[0] < 0 or starting_square_location[1] < 0:
-            raise InvalidSquare
-
-        if destination_square_location[0] > 7 or destination_square_location[1] > 7:
-            raise InvalidSquare
-
-        if destination_square_location[0] < 0 or destination_square_location[1] < 0:
-            raise InvalidSquare
-
-        if self._board[starting_square_location[0]][starting_square_location[1]] is None or\
-                self._board[destination_square_location[0]][destination_square_location[1]] is None:
-            raise InvalidSquare
-
-        if self._board[starting_square_location[0]][starting_square_location[1]] == "White" and\
-                movement_direction_x <= 0:
-            raise InvalidMove
-
-        if self._board[starting_square_location[0]][starting_square_location[1]] == "Black" and\
-                movement_direction_x >= 0:
-            raise InvalidMove
-
-        if self._board[destination_square_location[0]][destination_square_location[1]] != "Empty":
-            raise InvalidMove
-
-
+        if color == "Black":
+            own_squares, opponent_squares = self._black_squares, self._white_squares
         else:
+            own_squares, opponent_squares = self._white_squares, self._black_squares
 
-            start_checker = self._board[starting_square_location[0]][starting_square_location[1]]
-
-
-            self._board[destination_square_location[0]][destination_square_location[1]] = \
-                self.get_checker_details(starting_square_location)
-            self._board[starting_square_location[0]][starting_square_location[1]] = "Empty"
-
-            jumped_piece = (int((starting_square_location[0] + destination_square_location[0]) / 2),
-                            int((starting_square_location[1] + destination_square_location[1]) / 2))
-
-            jumped_piece_color = self.get_checker_details(jumped_piece)
-
-            jumped_check = int((jumped_piece[0] - starting_square_location[0]))
-
-
-            #Code for jumping
-
-            if abs(movement_direction_x) == 2 and abs(destination_square_location[1] - starting_square_location[1]) == 2 and \
-                abs(jumped_check) == 1:
-
-                white_pieces = ("White", "White_king", "White_Triple_king")
-                black_pieces = ("Black", "Black_king", "Black_Triple_king")
-
-                if start_checker in white_pieces and jumped_piece_color in black_pieces:
-                    self._board[jumped_piece[0]][jumped_piece[1]] = "Empty"
-                    player_object.add_captured_piece_count()
-
-                elif start_checker in black_pieces and jumped_piece_color in white_pieces:
-                    self._board[jumped_piece[0]][jumped_piece[1]] = "Empty"
-                    player_object.add_captured_piece_count()
-
-                elif start_checker in white_pieces and jumped_piece_color in white_pieces:
-                    raise InvalidMove
-
-                elif start_checker in black_pieces and jumped_piece_color in black_pieces:
-                    raise InvalidMove
-
+        own_squares.discard(sr * 4 + sc // 2)
+        own_squares.add(dr * 4 + dc // 2)
 
-            #Code for King creation
-            if destination_square_location[0] == 0 and self.get_checker_details(destination_square_location) == "Black": # Creation of black king
-                self._board[destination_square_location[0]][destination_square_location[1]] = "Black_king"
-                player_object.add_king()
+        if captured:
+            opponent_squares.discard(((sr + dr) >> 1) * 4 + ((sc + dc) >> 1) // 2)
 
-            if destination_square_location[0] == 7 and self.get_checker_details(destination_square_location) == "White": # Creation of white king
-                self._board[destination_square_location[0]][destination_square_location[1]] = "White_king"
-                player_object.add_king()
+        player_object._apply(captures=captured,
+                             kings=1 if promoted in (BLACK_K, WHITE_K) else 0,
+                             triples=1 if promoted in (BLACK_TK, WHITE_TK) else 0)
 
-            if destination_square_location[0] == 0 and self.get_checker_details(destination_square_location) == "White_king":  # Creation of white triple king
-                self._board[destination_square_location[0]][destination_square_location[1]] = "White_Triple_king"
-                player_object.add_triple_king()
 
-            if destination_square_location[0] == 7 and self.get_checker_details(destination_square_location) == "Black_king":  # Creation of black triple king
-                self._board[destination_square_location[0]][destination_square_location[1]] = "Black_Triple_king"
-                player_object.add_triple_king()
+        # The game ends once the opponent has no pieces left. Each side
+        # starts with twelve and pieces only leave the board by capture.
+        if captured and player_object.get_captured_pieces_count() == 12:
+            self.end_game(player_name)
 
+        if more_jumps:
+            self._last_turn_finished = False
 
-            if player_object.get_captured_pieces_count() == 12:
-                self.end_game(player_name)
 
-            
-            # Code for multiple jumps (edge-safe)
-            dest_row, dest_col = destination_square_location
-            piece_after_move = self._board[dest_row][dest_col]
-
-            white_pieces = ("White", "White_king", "White_Triple_king")
-            black_pieces = ("Black", "Black_king", "Black_Triple_king")
+        self._last_destination = destination_square_location
 
-            # Directions: up-left, up-right, down-left, down-right
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        self.change_turn()
 
-            has_more_jumps = False
+        return player_object.get_captured_pieces_count()
 
-            for dr, dc in directions:
-                mid_r, mid_c = dest_row + dr, dest_col + dc
-                land_r, land_c = dest_row + 2 * dr, dest_col + 2 * dc
 
-                # Skip if either square is off-board
-                if not (self._is_on_board(mid_r, mid_c) and self._is_on_board(land_r, land_c)):
-                    continue
+    def legal_moves(self, color):
+        """
+        List every legal move for the given color.
 
-                mid_piece = self._board[mid_r][mid_c]
-                landing_square = self._board[land_r][land_c]
+        Args:
+            color (str): "Black" or "White".
 
-                if landing_square != "Empty":
-                    continue
+        Returns:
+            Iterator[tuple[tuple[int, int], tuple[int, int]]]:
+                (start, destination) pairs that play_game would accept for a
+                player of that color on their turn. If any capture is
+                available, only captures are returned.
 
-                # For normal pieces, restrict direction (Black moves up, White moves down)
-                if piece_after_move == "Black" and dr != -1:
-                    continue
-                if piece_after_move == "White" and dr != 1:
-                    continue
-                # Kings and triple kings can move in all directions
+        Raises:
+            InvalidPlayer: If the color is invalid.
 
-                if piece_after_move in white_pieces and mid_piece in black_pieces:
-                    has_more_jumps = True
-                    break
+        Notes:
+            Turn order is not considered, so a search can generate replies
+            for either side without making a move first.
 
-                if piece_after_move in black_pieces and mid_piece in white_pieces:
-                    has_more_jumps = True
-                    break
+            Multi-jump continuations are not listed. While
+            get_last_turn_finished() is False, play_game also lets the side
+            that just moved play again from get_last_destination(), even
+            though the turn has passed; callers that search must generate
+            those moves themselves.
+        """
 
-            if has_more_jumps:
-                self._last_turn_finished = False
+        if color == "Black":
+            own_squares, enemy = self._black_squares, self._bb_white
+        elif color == "White":
+            own_squares, enemy = self._white_squares, self._bb_black
+        else:
+            raise InvalidPlayer(f"Invalid piece color: {color}")
 
+        empty = ~(self._bb_black | self._bb_white)
+        jumps = []
+        steps = []
 
-        self._last_destination = destination_square_location
+        for square in own_squares:
+            piece = self._piece_at(square)
+            start = _COORDS[square]
 
-        self.change_turn()
+            for mid, land in _MOVE_TABLE[(square, piece)]:
+                if (1 << mid) & enemy and (1 << land) & empty:
+                    jumps.append((start, _COORDS[land]))
 
-        return player_object.get_captured_pieces_count()
+            # Once a capture is known, plain steps can no longer be played.
+            if not jumps:
+                for land in _STEP_TABLE[(square, piece)]:
+                    if (1 << land) & empty:
+                        steps.append((start, _COORDS[land]))
 
+        return iter(jumps or steps)
 
     def get_checker_details(self, square_location):
         """
@@ -436,33 +727,52 @@ class Checkers:
                 If the square is outside the bounds of the board.
         """
 
-        x_coord, y_coord = square_location
-
-        if x_coord < 0 or x_coord > 7 or y_coord < 0 or y_coord > 7:
-            raise InvalidSquare
-
-        checker = self._board[x_coord][y_coord]
-
-        if checker == "Empty":
-            return None
-        else:
-            return checker
+        return _NAMES[self._checker_at(square_location)]
 
-    def print_board(self):
+    def print_board(self, file=None):
         """
-        Print the current board state as a nested list.
+        Print the current board state as eight rows of text.
+
+        Args:
+            file: A writable text stream; defaults to sys.stdout.
 
         Output Format:
-            A printed 2-D list representing the 8×8 board.
-            Example row:
-                [None, "White", None, "White", None, "White", None, "White"]
+            One line per row, row 0 first, with each square shown as a
+            two-character cell separated by spaces:
+                "  " light square       ".." empty dark square
+                "b " / "w " piece       "bK" / "wK" king
+                "bT" / "wT" triple king
+            Example row (the opening position's row 0):
+                "   w     w     w     w"
 
         Notes:
-            - Only dark squares contain pieces; light squares remain None.
+            - Trailing spaces are trimmed from each line.
+            - The text is built straight from the bitboards and written in
+              a single call.
             - This function prints the board but does not return it.
         """
 
-        print(self.get_board())
+        cells = [".."] * 32
+        men = ~(self._bb_kings | self._bb_triple)
+        placements = ((BLACK, self._bb_black & men), (WHITE, self._bb_white & men),
+                      (BLACK_K, self._bb_black & self._bb_kings),
+                      (WHITE_K, self._bb_white & self._bb_kings),
+                      (BLACK_TK, self._bb_black & self._bb_triple),
+                      (WHITE_TK, self._bb_white & self._bb_triple))
+
+        for piece, bitboard in placements:
+            while bitboard:
+                lowest = bitboard & -bitboard
+                cells[lowest.bit_length() - 1] = _GLYPHS[piece]
+                bitboard ^= lowest
+
+        lines = []
+
+        for row in range(8):
+            lines.append(" ".join(cells[row * 4 + col // 2] if (row + col) % 2 else "  "
+                                  for col in range(8)).rstrip())
+
+        (file or sys.stdout).write("\n".join(lines) + "\n")
 
     def game_winner(self):
         """
@@ -489,6 +799,9 @@ class Player:
     """
     Creates a player with a name and piece color. Used frequently throughout Checkers.
     """
+
+    __slots__ = ("_player_name", "_piece_color", "_king", "_triple_king", "_captured_piece")
+
     def __init__(self, player_name, piece_color):
         """
         Creates a player with a name and piece color from the two parameters taken.
@@ -551,3 +864,11 @@ class Player:
         """
         self._captured_piece = self._captured_piece + 1
 
+    def _apply(self, *, captures=0, kings=0, triples=0):
+        """
+        Adds a move's captures, kings, and triple kings to the player's counts in one call.
+        """
+        self._captured_piece += captures
+        self._king += kings
+        self._triple_king += triples
+
@@ -3,6 +3,7 @@
 # Date: 3/14/2023 (updated for portfolio)
 # Description: Unit tests for the Checkers game engine.
 
+import io
 import unittest
 
 from CheckersGame import (
@@ -14,6 +15,9 @@ from CheckersGame import (
     OutofTurn,
 )
 
+# Built once; each test starts from a copy instead of a new board.
+_PRISTINE = Checkers()
+
 
 class TestCheckers(unittest.TestCase):
     """
@@ -24,7 +28,7 @@ class TestCheckers(unittest.TestCase):
         """
         Create a fresh game and two players for each test.
         """
-        self.game = Checkers()
+        self.game = _PRISTINE.copy()
         self.black = self.game.create_player("Trevor", "Black")
         self.white = self.game.create_player("Rovert", "White")
 
@@ -41,6 +45,23 @@ class TestCheckers(unittest.TestCase):
         self.assertEqual(player.get_player_name(), "Trevor")
         self.assertEqual(player.get_piece_color(), "Black")
 
+    def test_copy_is_independent(self):
+        """
+        Moves played on a copy do not change the original game or its players.
+        """
+        self.game.play_game("Trevor", (5, 2), (4, 3))
+        clone = self.game.copy()
+        clone.play_game("Rovert", (2, 5), (3, 4))
+        clone.play_game("Trevor", (4, 3), (2, 5))  # capture on the copy only
+
+        self.assertEqual(clone.get_player_object("Trevor").get_captured_pieces_count(), 1)
+        self.assertEqual(self.black.get_captured_pieces_count(), 0)
+        self.assertEqual(self.game.get_checker_details((4, 3)), "Black")
+        self.assertEqual(self.game.get_turn(), "White")
+
+        for slot in Checkers.__slots__:
+            self.assertTrue(hasattr(self.game.copy(), slot), slot)
+
     def test_get_checker_details_after_simple_moves(self):
         """
         get_checker_details() returns the correct piece after valid moves.
@@ -53,6 +74,20 @@ class TestCheckers(unittest.TestCase):
         self.assertEqual(self.game.get_checker_details((3, 0)), "White")
         self.assertIsNone(self.game.get_checker_details((2, 1)))
 
+    def test_print_board_writes_text_rows(self):
+        """
+        print_board() writes one line per row to the given stream.
+        """
+        self.game.play_game("Trevor", (5, 6), (4, 7))
+        out = io.StringIO()
+        self.game.print_board(file=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 8)
+        self.assertEqual(lines[0], "   w     w     w     w")
+        self.assertEqual(lines[4], "   ..    ..    ..    b")
+        self.assertEqual(lines[5], "b     b     b     ..")
+
     # ----------------------------------------------------------------------
     # Capturing and promotion tests
     # ----------------------------------------------------------------------
@@ -69,6 +104,26 @@ class TestCheckers(unittest.TestCase):
 
         self.assertEqual(self.black.get_captured_pieces_count(), 1)
 
+    def test_white_capture_and_rejected_jumps(self):
+        """
+        White can capture, but not jump an empty square or its own piece.
+        """
+        self.game.play_game("Trevor", (5, 2), (4, 3))
+
+        with self.assertRaises(InvalidMove):
+            self.game.play_game("Rovert", (2, 7), (4, 5))  # over empty (3, 6)
+
+        with self.assertRaises(InvalidMove):
+            self.game.play_game("Rovert", (1, 0), (3, 2))  # over own (2, 1)
+
+        self.game.play_game("Rovert", (2, 5), (3, 4))
+        self.game.play_game("Trevor", (5, 6), (4, 5))
+        self.game.play_game("Rovert", (3, 4), (5, 2))  # capture
+
+        self.assertEqual(self.white.get_captured_pieces_count(), 1)
+        self.assertIsNone(self.game.get_checker_details((4, 3)))
+        self.assertEqual(self.game.get_checker_details((5, 2)), "White")
+
     def test_promotion_to_king(self):
         """
         Moving a piece to the far side should promote it to a king.
@@ -105,6 +160,65 @@ class TestCheckers(unittest.TestCase):
 
         self.assertEqual(self.black.get_captured_pieces_count(), 3)
 
+    def test_triple_king_promotion(self):
+        """
+        A black king reaching White's back row should become a triple king,
+        reported with the documented "Black_Triple_King" spelling.
+        """
+        self.game.play_game("Trevor", (5, 2), (4, 3))
+        self.game.play_game("Rovert", (2, 5), (3, 4))
+        self.game.play_game("Trevor", (4, 3), (2, 5))  # capture
+        self.game.play_game("Rovert", (2, 3), (3, 2))
+        self.game.play_game("Trevor", (5, 6), (4, 7))
+        self.game.play_game("Rovert", (1, 2), (2, 3))
+        self.game.play_game("Trevor", (4, 7), (3, 6))
+        self.game.play_game("Rovert", (0, 3), (1, 2))
+        self.game.play_game("Trevor", (2, 5), (0, 3))  # promote to king
+
+        # Walk the king down the board while Black clears a path to (7, 4).
+        moves = [
+            ("Rovert", (1, 6), (2, 5)), ("Trevor", (0, 3), (1, 4)),
+            ("Rovert", (2, 5), (3, 4)), ("Trevor", (1, 4), (2, 5)),
+            ("Rovert", (3, 4), (4, 3)), ("Trevor", (2, 5), (3, 4)),
+            ("Rovert", (0, 5), (1, 4)), ("Trevor", (3, 4), (4, 5)),
+            ("Rovert", (0, 7), (1, 6)), ("Trevor", (4, 5), (5, 6)),
+            ("Rovert", (1, 4), (2, 5)), ("Trevor", (5, 4), (4, 5)),
+            ("Rovert", (2, 1), (3, 0)), ("Trevor", (6, 3), (5, 2)),
+            ("Rovert", (1, 0), (2, 1)), ("Trevor", (6, 5), (5, 4)),
+            ("Rovert", (0, 1), (1, 0)), ("Trevor", (5, 6), (6, 5)),
+            ("Rovert", (2, 3), (3, 4)), ("Trevor", (7, 4), (6, 3)),
+            ("Rovert", (1, 2), (2, 3)),
+        ]
+        for player_name, start, dest in moves:
+            self.game.play_game(player_name, start, dest)
+
+        self.game.play_game("Trevor", (6, 5), (7, 4))  # reach White's side
+
+        self.assertEqual(self.black.get_triple_king_count(), 1)
+        self.assertEqual(self.game.get_checker_details((7, 4)), "Black_Triple_King")
+
+    def test_legal_moves_opening_and_forced_capture(self):
+        """
+        legal_moves() lists Black's seven opening moves, then only the
+        capture once one is available.
+        """
+        opening = list(self.game.legal_moves("Black"))
+        self.assertEqual(len(opening), 7)
+        self.assertIn(((5, 0), (4, 1)), opening)
+
+        self.game.play_game("Trevor", (5, 2), (4, 3))
+        self.game.play_game("Rovert", (2, 5), (3, 4))
+
+        self.assertEqual(list(self.game.legal_moves("Black")), [((4, 3), (2, 5))])
+
+    def test_legal_moves_invalid_color_raises(self):
+        """
+        legal_moves() should raise InvalidPlayer as soon as it is called
+        with a color that is not in the game.
+        """
+        with self.assertRaises(InvalidPlayer):
+            self.game.legal_moves("Red")
+
     # ----------------------------------------------------------------------
     # Error / exception tests
     # ----------------------------------------------------------------------
@@ -144,12 +258,106 @@ class TestCheckers(unittest.TestCase):
         with self.assertRaises(InvalidMove):
             self.game.play_game("Rovert", (2, 1), (2, 3))
 
+    def test_jump_without_enemy_piece_raises(self):
+        """
+        A two-square move over an empty square or the player's own piece
+        should raise InvalidMove and leave the game unchanged.
+        """
+        board, hash_before = self.game.get_board(), self.game.get_hash()
+
+        with self.assertRaises(InvalidMove):
+            self.game.play_game("Trevor", (5, 0), (3, 2))  # over empty (4, 1)
+
+        with self.assertRaises(InvalidMove):
+            self.game.play_game("Trevor", (6, 1), (4, 3))  # over own (5, 2)
+
+        self.assertEqual(self.game.get_board(), board)
+        self.assertEqual(self.game.get_hash(), hash_before)
+        self.assertEqual(self.game.get_turn(), "Black")
+        self.assertEqual(self.black.get_captured_pieces_count(), 0)
+
+    def test_rejected_continuation_changes_nothing(self):
+        """
+        A rejected move from the last destination while a jump is pending
+        should not hand the turn back or clear the pending continuation.
+        """
+        self.game.play_game("Trevor", (5, 4), (4, 3))
+        self.game.play_game("Rovert", (2, 3), (3, 2))  # (3, 2) can now jump (4, 3)
+        board, hash_before = self.game.get_board(), self.game.get_hash()
+
+        with self.assertRaises(InvalidMove):
+            self.game.play_game("Rovert", (3, 2), (4, 3))  # occupied
+
+        self.assertEqual(self.game.get_board(), board)
+        self.assertEqual(self.game.get_hash(), hash_before)
+        self.assertEqual(self.game.get_turn(), "Black")
+        self.assertFalse(self.game.get_last_turn_finished())
+
+        self.game.play_game("Rovert", (3, 2), (5, 4))  # the continuation still works
+        self.assertEqual(self.white.get_captured_pieces_count(), 1)
+
+    def test_hash_matches_for_transposed_move_orders(self):
+        """
+        Reaching the same position by different move orders should give the
+        same hash, and a different position a different hash.
+        """
+        other = _PRISTINE.copy()
+        other.create_player("Trevor", "Black")
+        other.create_player("Rovert", "White")
+        start_hash = self.game.get_hash()
+
+        self.game.play_game("Trevor", (5, 0), (4, 1))
+        self.game.play_game("Rovert", (2, 7), (3, 6))
+        self.game.play_game("Trevor", (5, 4), (4, 5))
+        self.game.play_game("Rovert", (2, 1), (3, 2))
+
+        other.play_game("Trevor", (5, 4), (4, 5))
+        other.play_game("Rovert", (2, 1), (3, 2))
+        other.play_game("Trevor", (5, 0), (4, 1))
+        other.play_game("Rovert", (2, 7), (3, 6))
+
+        self.assertEqual(self.game.get_hash(), other.get_hash())
+        self.assertNotEqual(self.game.get_hash(), start_hash)
+
     def test_game_winner_before_end(self):
         """
         Before the game ends, game_winner should report that the game has not ended.
         """
         self.assertEqual(self.game.game_winner(), "Game has not ended")
 
+    def test_game_winner_after_last_capture(self):
+        """
+        Capturing the opponent's last piece should end the game and make
+        game_winner() report the capturing player.
+        """
+        moves = [
+            ("Trevor", (5, 2), (4, 3)), ("Rovert", (2, 1), (3, 0)),
+            ("Trevor", (6, 3), (5, 2)), ("Rovert", (1, 2), (2, 1)),
+            ("Trevor", (5, 2), (4, 1)), ("Rovert", (3, 0), (5, 2)),
+            ("Trevor", (5, 6), (4, 5)), ("Rovert", (2, 1), (3, 0)),
+            ("Trevor", (4, 5), (3, 4)), ("Rovert", (2, 3), (4, 5)),
+            ("Trevor", (5, 4), (3, 6)), ("Rovert", (2, 7), (4, 5)),
+            ("Trevor", (6, 7), (5, 6)), ("Rovert", (4, 5), (6, 7)),
+            ("Trevor", (7, 4), (6, 3)), ("Rovert", (5, 2), (7, 4)),
+            ("Trevor", (6, 1), (5, 2)), ("Rovert", (7, 4), (5, 6)),
+            ("Trevor", (5, 2), (4, 1)), ("Rovert", (3, 0), (5, 2)),
+            ("Trevor", (7, 0), (6, 1)), ("Rovert", (5, 2), (7, 0)),
+            ("Trevor", (4, 3), (3, 4)), ("Rovert", (2, 5), (4, 3)),
+            ("Trevor", (7, 6), (6, 5)), ("Rovert", (5, 6), (7, 4)),
+            ("Trevor", (7, 2), (6, 3)), ("Rovert", (7, 4), (5, 2)),
+            ("Trevor", (5, 0), (4, 1)),
+        ]
+        for player_name, start, dest in moves:
+            self.game.play_game(player_name, start, dest)
+
+        self.assertEqual(self.game.game_winner(), "Game has not ended")
+
+        self.game.play_game("Rovert", (5, 2), (3, 0))  # takes Black's last piece
+
+        self.assertEqual(self.white.get_captured_pieces_count(), 12)
+        self.assertEqual(self.game.get_status(), "Over")
+        self.assertEqual(self.game.game_winner(), "Rovert")
+
 
 if __name__ == "__main__":
     unittest.main()